@@ -37,11 +37,7 @@ def get_element(text: str) -> str:
 
 	:param text: The remaining input to be parsed. It should not start with :data:`DIVIDER`
 	"""
-	pos = text.find(DIVIDER)
-	if pos == -1:
-		return text
-	else:
-		return text[:pos]
+	return text.partition(DIVIDER)[0]
 
 
 T = TypeVar('T')
@@ -67,6 +67,8 @@ class CommandContext(Dict[str, Any]):
 
 	:class:`CommandContext` also provides some other useful methods for getting information of the current command context
 	"""
+	__slots__ = ('__source', '__command', '__cursor', '__node_path', '__dict__', '__weakref__')
+
 	def __init__(self, source: 'CommandSource', command: str):
 		super().__init__()
 		self.__source = source
@@ -127,27 +129,60 @@ class CommandContext(Dict[str, Any]):
 	#      Not public APIs
 	# -------------------------
 
-	@contextmanager
-	def read_command(self, current_node: 'AbstractNode', result: 'ParseResult', new_cursor: int):
+	def _push_read(self, current_node: 'AbstractNode', result: 'ParseResult', new_cursor: int) -> int:
 		"""
 		**Not public API, only used in command parsing**
 		Change the current cursor position, and store the parsing value
 
+		:return: The previous cursor position, which should be passed to :meth:`_pop_read` later
 		:meta private:
 		"""
-		from mcdreforged.command.builder.nodes.basic import ArgumentNode
-
 		prev_cursor = self.__cursor
 		self.__cursor = new_cursor
+		current_node._store_parse_result(self, result)
+		return prev_cursor
 
-		if isinstance(current_node, ArgumentNode):
-			self[current_node.get_name()] = result.value
+	def _pop_read(self, current_node: 'AbstractNode', prev_cursor: int):
+		"""
+		**Not public API, only used in command parsing**
+		Revert what :meth:`_push_read` did
+
+		:meta private:
+		"""
+		self.__cursor = prev_cursor
+		current_node._remove_parse_result(self)
+
+	def _push_node(self, node: 'AbstractNode'):
+		"""
+		**Not public API, only used in command parsing**
+		Enter a command node, maintain the node_path
+
+		:meta private:
+		"""
+		self.__node_path.append(node)
+
+	def _pop_node(self):
+		"""
+		**Not public API, only used in command parsing**
+		Leave the current command node, maintain the node_path
+
+		:meta private:
+		"""
+		self.__node_path.pop()
+
+	@contextmanager
+	def read_command(self, current_node: 'AbstractNode', result: 'ParseResult', new_cursor: int):
+		"""
+		**Not public API, only used in command parsing**
+		Change the current cursor position, and store the parsing value
+
+		:meta private:
+		"""
+		prev_cursor = self._push_read(current_node, result, new_cursor)
 		try:
 			yield
 		finally:
-			self.__cursor = prev_cursor
-			if isinstance(current_node, ArgumentNode):
-				self.pop(current_node.get_name(), None)
+			self._pop_read(current_node, prev_cursor)
 
 	@contextmanager
 	def enter_child(self, node: 'AbstractNode'):
@@ -157,8 +192,8 @@ class CommandContext(Dict[str, Any]):
 
 		:meta private:
 		"""
-		self.__node_path.append(node)
+		self._push_node(node)
 		try:
 			yield
 		finally:
-			self.__node_path.pop(len(self.__node_path) - 1)
+			self._pop_node()
@@ -1,11 +1,10 @@
-import collections
 import inspect
 import sys
 from abc import ABC
 from types import MethodType
-from typing import List, Callable, Iterable, Set, Dict, Type, Any, Union, Optional, NamedTuple
+from typing import List, Callable, Iterable, Set, Dict, Type, Any, Union, Optional, NamedTuple, Sequence, Tuple, Iterator
 
-from typing_extensions import Self
+from typing_extensions import Self, NoReturn
 
 from mcdreforged.command.builder import command_builder_util as utils
 from mcdreforged.command.builder.common import ParseResult, CommandContext, CommandSuggestions, CommandSuggestion
@@ -37,17 +36,65 @@ class CallbackError(Exception):
 		self.exc_info = sys.exc_info()
 
 
+def _get_callback_argc(callback: Callable) -> int:
+	"""
+	Get the amount of the positional arguments the given callback accepts
+	"""
+	argc = len(inspect.getfullargspec(callback).args)
+	if isinstance(callback, MethodType):  # class method, remove the 1st param
+		argc -= 1
+	return argc
+
+
+def _resolve_argc(callback: Callable) -> Optional[int]:
+	"""
+	Resolve the argument count of the callback at node building time
+
+	:return: The argument count, or None if the reflection fails.
+		In that case the reflection error will be reported when the callback is invoked
+	"""
+	try:
+		return _get_callback_argc(callback)
+	except Exception:
+		return None
+
+
+class _Callback(NamedTuple):
+	callback: Callable
+	argc: Optional[int]
+
+	@classmethod
+	def of(cls, callback: Callable) -> '_Callback':
+		return cls(callback, _resolve_argc(callback))
+
+
 class _ErrorHandler(NamedTuple):
+	error_type: Type[CommandError]
 	callback: ERROR_HANDLER_CALLBACK
+	argc: Optional[int]
 	handled: bool
 
 
 class _Requirement(NamedTuple):
-	requirement: REQUIRES_CALLBACK
-	failure_message_getter: Optional[FAIL_MSG_CALLBACK]
+	requirement: _Callback
+	failure_message_getter: Optional[_Callback]
+
+
+_ERROR_HANDLER_TYPE = Tuple[_ErrorHandler, ...]  # in registration order
 
 
-_ERROR_HANDLER_TYPE = Dict[Type[CommandError], _ErrorHandler]
+def _add_error_handler(error_handlers: _ERROR_HANDLER_TYPE, new_handler: _ErrorHandler) -> _ERROR_HANDLER_TYPE:
+	"""
+	:return: The new error handler tuple. The handler with the same error type will be replaced, at its original position
+	"""
+	for i, handler in enumerate(error_handlers):
+		if handler.error_type is new_handler.error_type:
+			return error_handlers[:i] + (new_handler,) + error_handlers[i + 1:]
+	return error_handlers + (new_handler,)
+
+
+_NONE_FAILURE_MESSAGE_GETTER = _Callback.of(lambda: None)
+_EMPTY_SUGGESTION_GETTER = _Callback.of(lambda: [])
 
 
 class AbstractNode(ABC):
@@ -55,16 +102,28 @@ class AbstractNode(ABC):
 	:class:`AbstractNode` is base class of all command nodes. It's also an abstract class.
 	It provides several methods for building up the command tree
 	"""
+	__slots__ = (
+		'_children_literal', '_children', '_children_cache', '_has_children', '_frozen',
+		'_callback', '_error_handlers', '_child_error_handlers', '_requirements', '_redirect_node', '_dispatch_target', '_suggestion_getter',
+		# keep the nodes weak-referable and open to extra attributes, like before. The dict is only created when used
+		'__dict__', '__weakref__',
+	)
 
 	def __init__(self):
-		self._children_literal: Dict[str, List[Literal]] = collections.defaultdict(list)  # mapping from literal text to related Literal nodes
-		self._children: List[AbstractNode] = []
-		self._callback: Optional[RUNS_CALLBACK] = None
-		self._error_handlers: _ERROR_HANDLER_TYPE = {}
-		self._child_error_handlers: _ERROR_HANDLER_TYPE = {}
+		# mapping from literal text to related Literal nodes. The value is the Literal node itself if there's only 1 related node
+		# the collections become tuples after the node is frozen
+		self._children_literal: Dict[str, Union[Literal, Sequence[Literal]]] = {}
+		self._children: Sequence[AbstractNode] = []
+		self._children_cache: Optional[Tuple[AbstractNode, ...]] = None  # cached result of get_children()
+		self._has_children: bool = False
+		self._frozen: bool = False
+		self._callback: Optional[_Callback] = None
+		self._error_handlers: _ERROR_HANDLER_TYPE = ()
+		self._child_error_handlers: _ERROR_HANDLER_TYPE = ()
 		self._requirements: List[_Requirement] = []
 		self._redirect_node: Optional[AbstractNode] = None
-		self._suggestion_getter: SUGGESTS_CALLBACK = lambda: []
+		self._dispatch_target: AbstractNode = self  # the node whose children are used in parsing, i.e. the redirect node or itself
+		self._suggestion_getter: _Callback = _EMPTY_SUGGESTION_GETTER
 
 	# --------------
 	#   Interfaces
@@ -94,11 +153,15 @@ class AbstractNode(ABC):
 		if self._redirect_node is not None:
 			raise IllegalNodeOperation('Redirected node is not allowed to add child nodes')
 		class_util.check_type(node, AbstractNode)
-		if isinstance(node, Literal):
-			for literal in node.literals:
-				self._children_literal[literal].append(node)
-		else:
-			self._children.append(node)
+		frozen = self._frozen
+		if frozen:
+			self.__unfreeze()
+		node._register_into_parent(self)
+		self._children_cache = None
+		self._has_children = True
+		if frozen:
+			# refreeze, so the node and the newly added subtree get frozen as well
+			self.freeze()
 		return self
 
 	def runs(self, func: RUNS_CALLBACK) -> Self:
@@ -133,7 +196,7 @@ class AbstractNode(ABC):
 			Argument list: :class:`~mcdreforged.command.command_source.CommandSource`, :class:`dict` (:class:`~mcdreforged.command.builder.common.CommandContext`)
 		"""
 		class_util.check_type(func, Callable)
-		self._callback = func
+		self._callback = _Callback.of(func)
 		return self
 
 	def requires(self, requirement: REQUIRES_CALLBACK, failure_message_getter: Optional[FAIL_MSG_CALLBACK] = None) -> Self:
@@ -161,10 +224,16 @@ class AbstractNode(ABC):
 			node1.requires(lambda src: src.has_permission(3))  # Permission check
 			node2.requires(lambda src, ctx: ctx['page_count'] <= get_max_page())  # Dynamic range check
 			node3.requires(lambda src, ctx: is_legal(ctx['target']), lambda src, ctx: 'target {} is illegal'.format(ctx['target']))  # Customized failure message
+
+		.. note:: The context passed to *requirement* and *failure_message_getter* is the one being used in the command parsing,
+			so it should only be read, not be modified or stored
 		"""
 		class_util.check_type(requirement, Callable)
 		class_util.check_type(failure_message_getter, [Callable, None])
-		self._requirements.append(_Requirement(requirement, failure_message_getter))
+		self._requirements.append(_Requirement(
+			_Callback.of(requirement),
+			_Callback.of(failure_message_getter) if failure_message_getter is not None else None
+		))
 		return self
 
 	def redirects(self, redirect_node: 'AbstractNode') -> Self:
@@ -196,6 +265,7 @@ class AbstractNode(ABC):
 			raise IllegalNodeOperation('Node with children nodes is not allowed to be redirected')
 		class_util.check_type(redirect_node, AbstractNode)
 		self._redirect_node = redirect_node
+		self._dispatch_target = redirect_node
 		return self
 
 	def suggests(self, suggestion: SUGGESTS_CALLBACK) -> Self:
@@ -217,9 +287,11 @@ class AbstractNode(ABC):
 
 		:param suggestion: A callable function which accepts up to 2 parameters and return an iterable of str indicating the current command suggestions.
 			Argument list: :class:`~mcdreforged.command.command_source.CommandSource`, :class:`dict` (:class:`~mcdreforged.command.builder.common.CommandContext`)
+
+		.. note:: Like the requirement callback in :meth:`requires`, the context passed to *suggestion* should only be read
 		"""
 		class_util.check_type(suggestion, Callable)
-		self._suggestion_getter = suggestion
+		self._suggestion_getter = _Callback.of(suggestion)
 		return self
 
 	def on_error(self, error_type: Type[CommandError], handler: ERROR_HANDLER_CALLBACK, *, handled: bool = False) -> Self:
@@ -237,7 +309,7 @@ class AbstractNode(ABC):
 			raise TypeError('error_type parameter should be a class inherited from CommandError, but class {} found'.format(error_type))
 		class_util.check_type(error_type, Type)
 		class_util.check_type(handler, Callable)
-		self._error_handlers[error_type] = _ErrorHandler(handler, handled)
+		self._error_handlers = _add_error_handler(self._error_handlers, _ErrorHandler(error_type, handler, _resolve_argc(handler), handled))
 		return self
 
 	def on_child_error(self, error_type: Type[CommandError], handler: ERROR_HANDLER_CALLBACK, *, handled: bool = False) -> Self:
@@ -248,7 +320,7 @@ class AbstractNode(ABC):
 			raise TypeError('error_type parameter should be a class inherited from CommandError, but class {} found'.format(error_type))
 		class_util.check_type(error_type, Type)
 		class_util.check_type(handler, Callable)
-		self._child_error_handlers[error_type] = _ErrorHandler(handler, handled)
+		self._child_error_handlers = _add_error_handler(self._child_error_handlers, _ErrorHandler(error_type, handler, _resolve_argc(handler), handled))
 		return self
 
 	def print_tree(self, line_writer: tree_printer.LineWriter = print):
@@ -268,15 +340,70 @@ class AbstractNode(ABC):
 	def _get_usage(self) -> str:
 		raise NotImplementedError()
 
+	def _register_into_parent(self, parent: 'AbstractNode'):
+		"""
+		Store this node into the children collection of the parent node. Invoked in :meth:`then`
+		"""
+		parent._children.append(self)
+
 	def has_children(self):
-		return len(self._children) + len(self._children_literal) > 0
+		return self._has_children
 
 	def get_children(self) -> List['AbstractNode']:
-		children = []
-		for literal_list in self._children_literal.values():
-			children.extend(literal_list)
-		children.extend(self._children)
-		return misc_util.unique_list(children)
+		return list(self.__get_children_tuple())
+
+	def __get_children_tuple(self) -> Tuple['AbstractNode', ...]:
+		if self._children_cache is None:
+			children = []
+			for entry in self._children_literal.values():
+				children.extend(_iterate_literal_entry(entry))
+			children.extend(self._children)
+			self._children_cache = tuple(misc_util.unique_list(children))
+		return self._children_cache
+
+	def freeze(self):
+		"""
+		Convert the children collections of the nodes in the command tree into tuples, for faster iterations in command parsing
+
+		It's invoked automatically on the first command execution / suggestion generation of an entry node.
+		It's still allowed to add child nodes with :meth:`then` after freezing, which unfreezes the node and refreezes it with the new child
+
+		:meta private:
+		"""
+		if self._frozen:
+			return
+		self._frozen = True
+		self._children = tuple(self._children)
+		self._children_literal = {
+			literal: entry if isinstance(entry, Literal) else tuple(entry)
+			for literal, entry in self._children_literal.items()
+		}
+		for child in self.__get_children_tuple():
+			child.freeze()
+		if self._redirect_node is not None:
+			self._redirect_node.freeze()
+
+	def __unfreeze(self):
+		self._frozen = False
+		self._children = list(self._children)
+		self._children_literal = {
+			literal: entry if isinstance(entry, Literal) else list(entry)
+			for literal, entry in self._children_literal.items()
+		}
+
+	def _store_parse_result(self, context: CommandContext, result: ParseResult):
+		"""
+		Store the parsing value of this node into the context. Invoked when the command parsing enters this node
+
+		Nodes that do not produce a value, e.g. :class:`Literal`, store nothing
+		"""
+		pass
+
+	def _remove_parse_result(self, context: CommandContext):
+		"""
+		Revert what :meth:`_store_parse_result` did. Invoked when the command parsing leaves this node
+		"""
+		pass
 
 	def parse(self, text: str) -> ParseResult:
 		"""
@@ -291,191 +418,274 @@ class AbstractNode(ABC):
 		raise NotImplementedError()
 
 	@staticmethod
-	def __smart_callback(callback: Callable, *args):
-		sig = inspect.signature(callback)
-		spec_args = inspect.getfullargspec(callback).args
-		spec_args_len = len(spec_args)
-		if isinstance(callback, MethodType):  # class method, remove the 1st param
-			spec_args_len -= 1
-		try:
-			sig.bind(*args[:spec_args_len])  # test if using full arg length is ok
-		except TypeError:
-			raise
-
-		# make sure all passed CommandContext are copies
-		args = list(args)
-		for i in range(len(args)):
-			arg = args[i]
-			if isinstance(arg, CommandContext):
-				args[i] = arg.copy()
+	def __get_argc(slot: Union[_Callback, _ErrorHandler]) -> int:
+		argc = slot.argc
+		if argc is None:  # reflection failed at node building time, retry to raise the error
+			argc = _get_callback_argc(slot.callback)
+		return argc
+
+	@classmethod
+	def __call_readonly(cls, slot: _Callback, source: CommandSource, context: CommandContext):
+		"""
+		Invoke a callback that only reads the context and returns a value, i.e. requirement, failure message getter and suggestion getter.
+		The live context is passed without copying
+		"""
+		argc = cls.__get_argc(slot)
+		if argc >= 2:
+			return slot.callback(source, context)
+		elif argc == 1:
+			return slot.callback(source)
+		else:
+			return slot.callback()
 
-		return callback(*args[:spec_args_len])
+	@classmethod
+	def __call_with_context_copy(cls, slot: Union[_Callback, _ErrorHandler], context: CommandContext, *args):
+		"""
+		Invoke a callback that might store or modify the context, i.e. command callback and error handler.
+		A copy of the context is passed after *args, if the callback accepts it
+		"""
+		argc = cls.__get_argc(slot)
+		if argc > len(args):
+			args = (*args, context.copy())
+		return slot.callback(*args[:argc])
 
 	def __handle_error(self, error: CommandError, context: CommandContext, error_handlers: _ERROR_HANDLER_TYPE):
-		for error_type, handler in error_handlers.items():
-			if isinstance(error, error_type):
+		for handler in error_handlers:
+			if isinstance(error, handler.error_type):
 				try:
-					self.__smart_callback(handler.callback, context.source, error, context)
+					self.__call_with_context_copy(handler, context, context.source, error)
 				except Exception as e:
 					raise CallbackError(e, context, 'error handling')
 				if handler.handled:
 					error.set_handled()
 
-	def __raise_error(self, error: CommandError, context: CommandContext):
+	def __raise_error(self, error: CommandError, context: CommandContext) -> NoReturn:
 		self.__handle_error(error, context, self._error_handlers)
 		raise error
 
-	def __check_requirements(self, context: CommandContext) -> Optional[FAIL_MSG_CALLBACK]:
+	def __check_requirements(self, context: CommandContext) -> Optional[_Callback]:
 		"""
 		:return: None: requirement check passed;
 		failure_message_getter: requirement check failed
 		"""
 		for req in self._requirements:
 			try:
-				ok = self.__smart_callback(req.requirement, context.source, context)
+				ok = self.__call_readonly(req.requirement, context.source, context)
 			except Exception as e:
 				raise CallbackError(e, context, 'requirements check')
 			else:
 				if not ok:
-					return req.failure_message_getter or (lambda: None)
+					return req.failure_message_getter or _NONE_FAILURE_MESSAGE_GETTER
 		return None
 
 	def _get_suggestions(self, context: CommandContext) -> Iterable[str]:
+		if self._suggestion_getter is _EMPTY_SUGGESTION_GETTER:
+			return ()
 		try:
-			return self.__smart_callback(self._suggestion_getter, context.source, context)
+			return self.__call_readonly(self._suggestion_getter, context.source, context)
 		except Exception as e:
 			raise CallbackError(e, context, 'suggestions fetching')
 
-	def _execute_command(self, context: CommandContext) -> None:
+	def __enter_node(self, context: CommandContext, command_remaining: str) -> Optional['_ExecutionFrame']:
+		"""
+		Parse the command at this node, and execute the command callback if the parsing finishes here
+
+		:param command_remaining: Same as ``context.command_remaining``, passed from the parent node to avoid the re-slicing
+		:return: None: the command execution finished;
+		_ExecutionFrame: the command parsing should continue at the child node in the frame
+		:raise CommandError: if the command parsing fails at this node. The error handlers of this node have been invoked
+		"""
 		command = context.command  # type: str
 		try:
-			parse_result = self.parse(context.command_remaining)
+			parse_result = self.parse(command_remaining)
 		except CommandSyntaxError as error:
 			error.set_parsed_command(context.command_read)
-			error.set_failed_command(context.command_read + context.command_remaining[:error.char_read])
+			error.set_failed_command(command[:context.cursor + error.char_read])
 			self.__raise_error(error, context)
 		else:
-			next_remaining = utils.remove_divider_prefix(context.command_remaining[parse_result.char_read:])  # type: str
+			next_remaining = utils.remove_divider_prefix(command_remaining[parse_result.char_read:])  # type: str
 			total_read = len(command) - len(next_remaining)  # type: int
 
-			with context.read_command(self, parse_result, total_read):
-				getter = self.__check_requirements(context)
-				if getter is not None:  # requirement check failed
+		prev_cursor = context._push_read(self, parse_result, total_read)
+		descending = False
+		try:
+			getter = self.__check_requirements(context) if len(self._requirements) > 0 else None
+			if getter is not None:  # requirement check failed
+				try:
+					failure_message = self.__call_readonly(getter, context.source, context)
+				except Exception as e:
+					raise CallbackError(e, context, 'failure message fetching')
+				self.__raise_error(RequirementNotMet(context.command_read, context.command_read, failure_message), context)
+
+			# Parsing finished
+			if len(next_remaining) == 0:
+				callback = self._callback
+				if callback is None:
+					callback = self._dispatch_target._callback
+				if callback is not None:
 					try:
-						failure_message = self.__smart_callback(getter, context.source, context)
+						self.__call_with_context_copy(callback, context, context.source)
 					except Exception as e:
-						raise CallbackError(e, context, 'failure message fetching')
-					self.__raise_error(RequirementNotMet(context.command_read, context.command_read, failure_message), context)
-
-				# Parsing finished
-				if len(next_remaining) == 0:
-					callback = self._callback
-					if callback is None and self._redirect_node is not None:
-						callback = self._redirect_node._callback
-					if callback is not None:
-						try:
-							self.__smart_callback(callback, context.source, context)
-						except Exception as e:
-							raise CallbackError(e, context, 'command callback')
-					else:
-						self.__raise_error(UnknownCommand(context.command_read, context.command_read), context)
-				# Un-parsed command string remains
+						raise CallbackError(e, context, 'command callback')
 				else:
-					# Redirecting
-					node = self if self._redirect_node is None else self._redirect_node
-
-					argument_unknown = False
-					# No child at all
-					if not node.has_children():
-						argument_unknown = True
-					else:
-						# Pass the remaining command string to the children
-						next_literal = utils.get_element(next_remaining)
-						try:
-							# Check literal children first
-							literal_error = None
-							for child_literal in node._children_literal.get(next_literal, []):
-								try:
-									with context.enter_child(child_literal):
-										child_literal._execute_command(context)
-									break
-								except CommandError as e:
-									# it's ok for a direct literal node to fail
-									# other literal might still have a chance to consume this command
-									literal_error = e
-							else:  # All literal children fails
-								if literal_error is not None:
-									raise literal_error
-								for child in node._children:
-									with context.enter_child(child):
-										child._execute_command(context)
-									break
-								else:  # No argument child
-									argument_unknown = True
-
-						except CommandError as error:
-							self.__handle_error(error, context, self._child_error_handlers)
-							raise error from None
-
-					if argument_unknown:
-						self.__raise_error(UnknownArgument(context.command_read, command), context)
-
-	def _generate_suggestions(self, context: CommandContext) -> CommandSuggestions:
+					self.__raise_error(UnknownCommand(context.command_read, context.command_read), context)
+				return None
+
+			# Un-parsed command string remains
+			# Redirecting
+			node = self._dispatch_target
+
+			# Pass the remaining command string to the children
+			# Check literal children first
+			literal_entry = node._children_literal.get(utils.get_element(next_remaining)) if node._has_children else None
+			if isinstance(literal_entry, Literal):
+				# the most common case: only 1 literal child matches
+				frame = _ExecutionFrame(self, prev_cursor, next_remaining, literal_entry, None)
+			elif literal_entry is not None:
+				# other literal might still have a chance to consume this command, if the previous one fails
+				literal_candidates = iter(literal_entry)
+				frame = _ExecutionFrame(self, prev_cursor, next_remaining, next(literal_candidates), literal_candidates)
+			elif len(node._children) > 0:
+				frame = _ExecutionFrame(self, prev_cursor, next_remaining, node._children[0], None)
+			else:  # No child to pass to
+				self.__raise_error(UnknownArgument(context.command_read, command), context)
+			descending = True
+			return frame
+		finally:
+			if not descending:
+				context._pop_read(self, prev_cursor)
+
+	def _execute_command(self, context: CommandContext, command_remaining: str) -> None:
+		"""
+		Execute the command, starting from this node
+
+		The command tree is walked with an explicit stack of the entered nodes, instead of recursive calls
+
+		:param command_remaining: Same as ``context.command_remaining``. This node should be the current node of the context
+		"""
+		stack: List[_ExecutionFrame] = []
+		node: AbstractNode = self
+		# local aliases for the hot loop
+		push_node, pop_node = context._push_node, context._pop_node
+		while True:
+			try:
+				frame = node.__enter_node(context, command_remaining)
+			except CommandError as e:
+				error = e
+			else:
+				if frame is None:  # command executed
+					return
+				stack.append(frame)
+				node, command_remaining = frame.child, frame.next_remaining
+				push_node(node)
+				continue
+
+			# Propagate the error to the parent nodes
+			while True:
+				if len(stack) == 0:
+					raise error
+				pop_node()
+				frame = stack[-1]
+				if frame.literal_candidates is not None:
+					# it's ok for a direct literal node to fail
+					# try the next literal child with the same literal
+					next_literal = next(frame.literal_candidates, None)
+					if next_literal is not None:
+						frame.child = next_literal
+						push_node(next_literal)
+						node, command_remaining = next_literal, frame.next_remaining
+						break
+				stack.pop()
+				frame.node.__handle_error(error, context, frame.node._child_error_handlers)
+				context._pop_read(frame.node, frame.prev_cursor)
+
+	def _generate_suggestions(self, context: CommandContext, command_remaining: str) -> CommandSuggestions:
 		"""
 		Return a list of tuple (suggested command, suggested argument)
+
+		:param command_remaining: Same as ``context.command_remaining``, passed from the parent node to avoid the re-slicing
 		"""
+		command = context.command  # type: str
+
 		def self_suggestions():
+			command_read_at_the_beginning = command[:cursor_at_the_beginning]
 			return CommandSuggestions([CommandSuggestion(command_read_at_the_beginning, s) for s in self._get_suggestions(context)])
 
 		suggestions = CommandSuggestions()
 		# [!!aa bb cc] dd
 		# read         suggested
-		command_read_at_the_beginning = context.command_read
-		if len(context.command_remaining) == 0:
+		cursor_at_the_beginning = context.cursor  # the command read is sliced only when it's needed
+		if len(command_remaining) == 0:
 			return self_suggestions()
 		try:
-			result = self.parse(context.command_remaining)
+			result = self.parse(command_remaining)
 		except CommandSyntaxError:
 			return self_suggestions()
 		else:
-			success_read = len(context.command) - len(context.command_remaining) + result.char_read  # type: int
-			next_remaining = utils.remove_divider_prefix(context.command_remaining[result.char_read:])  # type: str
-			total_read = len(context.command) - len(next_remaining)  # type: int
+			success_read = cursor_at_the_beginning + result.char_read  # type: int
+			next_remaining = utils.remove_divider_prefix(command_remaining[result.char_read:])  # type: str
+			total_read = len(command) - len(next_remaining)  # type: int
+			parsing_finished = len(next_remaining) == 0
 
 			with context.read_command(self, result, total_read):
-				if self.__check_requirements(context) is not None:
+				if len(self._requirements) > 0 and self.__check_requirements(context) is not None:
 					return CommandSuggestions()
 
 				# Parsing finished
-				if len(next_remaining) == 0:
+				if parsing_finished:
 					# total_read == success_read means DIVIDER does not exist at the end of the input string
 					# in that case, ends at this current node
 					if success_read == total_read:
 						return self_suggestions()
 
-				node = self if self._redirect_node is None else self._redirect_node
+				node = self._dispatch_target
+				children_literal = node._children_literal
+				# local aliases for the loops
+				enter_child, extend = context.enter_child, suggestions.extend
 				# Check literal children first
-				children_literal = node._children_literal.get(utils.get_element(next_remaining), [])
-				for child_literal in children_literal:
-					with context.enter_child(child_literal):
-						suggestions.extend(child_literal._generate_suggestions(context))
-				if len(children_literal) == 0:
-					for literal_list in node._children_literal.values():
-						for child_literal in literal_list:
-							with context.enter_child(child_literal):
-								suggestions.extend(child_literal._generate_suggestions(context))
+				next_literal = utils.get_element(next_remaining)
+				literal_entry = children_literal.get(next_literal)
+				if literal_entry is not None:
+					for child_literal in _iterate_literal_entry(literal_entry):
+						with enter_child(child_literal):
+							extend(child_literal._generate_suggestions(context, next_remaining))
+				else:
+					for literal_entry in children_literal.values():
+						for child_literal in _iterate_literal_entry(literal_entry):
+							with enter_child(child_literal):
+								extend(child_literal._generate_suggestions(context, next_remaining))
 					usages = []
 					for child in node._children:
-						with context.enter_child(child):
-							suggestions.extend(child._generate_suggestions(context))
-							if len(next_remaining) == 0:
+						with enter_child(child):
+							extend(child._generate_suggestions(context, next_remaining))
+							if parsing_finished:
 								usages.append(child._get_usage())
-					if len(next_remaining) == 0:
+					if parsing_finished:
 						suggestions.complete_hint = '|'.join(usages)
 		return suggestions
 
 
+class _ExecutionFrame:
+	"""
+	A node that has been entered and is passing the command to its child, in the command execution
+	"""
+	__slots__ = ('node', 'prev_cursor', 'next_remaining', 'child', 'literal_candidates')
+
+	def __init__(self, node: AbstractNode, prev_cursor: int, next_remaining: str, child: AbstractNode, literal_candidates: Optional[Iterator['Literal']]):
+		self.node = node
+		self.prev_cursor = prev_cursor
+		self.next_remaining = next_remaining
+		self.child = child
+		self.literal_candidates = literal_candidates  # other not-yet-tried literal children with the same literal
+
+
+def _iterate_literal_entry(entry: Union['Literal', Sequence['Literal']]) -> Iterable['Literal']:
+	return (entry,) if isinstance(entry, Literal) else entry
+
+
 class EntryNode(AbstractNode, ABC):
+	__slots__ = ()
+
 	def execute(self, source: CommandSource, command: str):
 		"""
 		Parse and execute this command
@@ -485,10 +695,12 @@ class EntryNode(AbstractNode, ABC):
 		:raise CommandError: if parsing fails
 		:meta private:
 		"""
+		if not self._frozen:
+			self.freeze()
 		try:
 			context = CommandContext(source, command)
 			with context.enter_child(self):
-				self._execute_command(context)
+				self._execute_command(context, command)
 		except LiteralNotMatch as error:
 			# the root literal node fails to parse the first element
 			raise UnknownRootArgument(error.get_parsed_command(), error.get_failed_command()) from error
@@ -503,9 +715,11 @@ class EntryNode(AbstractNode, ABC):
 		:param command: the command string to execute
 		:meta private:
 		"""
+		if not self._frozen:
+			self.freeze()
 		context = CommandContext(source, command)
 		with context.enter_child(self):
-			return self._generate_suggestions(context)
+			return self._generate_suggestions(context, command)
 
 
 class Literal(EntryNode):
@@ -516,6 +730,8 @@ class Literal(EntryNode):
 
 	Literal node is the only node that can start a command execution
 	"""
+	__slots__ = ('literals', '_literals_tuple', '_usage_str')
+
 	def __init__(self, literal: str or Iterable[str]):
 		super().__init__()
 		if isinstance(literal, str):
@@ -530,14 +746,27 @@ class Literal(EntryNode):
 			if utils.DIVIDER in literal:
 				raise TypeError('DIVIDER character "{}" cannot be inside a literal'.format(utils.DIVIDER))
 		self.literals = literals  # type: Set[str]
-		self._suggestion_getter = lambda: self.literals
+		self._literals_tuple: Tuple[str, ...] = tuple(sorted(literals))
+		self._usage_str: str = '|'.join(self._literals_tuple)
+		self._suggestion_getter = _Callback(lambda: self._literals_tuple, 0)
 
 	def _get_usage(self) -> str:
-		return '|'.join(sorted(self.literals))
+		return self._usage_str
 
 	def suggests(self, suggestion: SUGGESTS_CALLBACK) -> 'AbstractNode':
 		raise IllegalNodeOperation('Literal node does not support suggests')
 
+	def _register_into_parent(self, parent: AbstractNode):
+		children_literal = parent._children_literal
+		for literal in self._literals_tuple:
+			entry = children_literal.get(literal)
+			if entry is None:
+				children_literal[literal] = self
+			elif isinstance(entry, Literal):
+				children_literal[literal] = [entry, self]
+			else:
+				entry.append(self)
+
 	def parse(self, text):
 		arg = utils.get_element(text)
 		if arg in self.literals:
@@ -558,6 +787,8 @@ class ArgumentNode(AbstractNode, ABC):
 
 	It has a str field ``name`` which is used as the key used in storing parsed value in context
 	"""
+	__slots__ = ('__name',)
+
 	def __init__(self, name: str):
 		super().__init__()
 		self.__name = name
@@ -565,6 +796,12 @@ class ArgumentNode(AbstractNode, ABC):
 	def get_name(self) -> str:
 		return self.__name
 
+	def _store_parse_result(self, context: CommandContext, result: ParseResult):
+		context[self.get_name()] = result.value
+
+	def _remove_parse_result(self, context: CommandContext):
+		context.pop(self.get_name(), None)
+
 	def _get_usage(self) -> str:
 		return '<{}>'.format(self.__name)
 
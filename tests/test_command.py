@@ -69,6 +69,13 @@ class CommandTestCase(ABC, unittest.TestCase):
 
 class CommandTreeTestCase(CommandTestCase):
 
+	# ---------
+	#   utils
+	# ---------
+
+	def get_suggestions(self, executor: Literal, command: str):
+		return sorted(set(map(lambda s: s.suggest_input, executor.generate_suggestions(TestCommandSource(), command))))
+
 	# ---------
 	#   Tests
 	# ---------
@@ -93,6 +100,12 @@ class CommandTreeTestCase(CommandTestCase):
 		self.assertEqual('a', children[2].get_name())
 		self.assertEqual('b', children[3].get_name())
 
+		# modifying the returned list doesn't affect the node
+		children.clear()
+		self.assertEqual(4, len(executor.get_children()))
+		executor.get_children().append(Literal('e'))
+		self.assertEqual(4, len(executor.get_children()))
+
 	def test_2_literal(self):
 		executor = Literal('test').runs(self.callback_hit)
 		self.assertRaises(UnknownArgument, self.run_command, executor, 'awa')
@@ -408,6 +421,71 @@ class CommandTreeTestCase(CommandTestCase):
 		for suggestion in suggestions:
 			self.run_command_and_check_hit(root, 'test {}'.format(suggestion), True)
 
+	def test_18_context_copy(self):
+		contexts = []
+		root = Literal('test').then(
+			Integer('a').
+			requires(lambda src, ctx: ctx['a'] > 0).
+			runs(lambda src, ctx: contexts.append(ctx))
+		)
+		self.run_command(root, 'test 1')
+		self.assertRaises(RequirementNotMet, self.run_command, root, 'test 0')
+		# the context stored by the command callback is a copy, so it's unaffected by the end of the parsing
+		self.assertEqual(1, len(contexts))
+		self.assertEqual({'a': 1}, contexts[0])
+		self.assertEqual('test 1', contexts[0].command_read)
+
+	def test_19_suggestion(self):
+		root = Literal('test').then(
+			Literal('a').then(Literal('b'))
+		).then(
+			Literal('a').then(Literal('c'))
+		).then(
+			Literal(['x', 'y'])
+		)
+		self.assertEqual(['a', 'x', 'y'], self.get_suggestions(root, 'test '))
+		self.assertEqual(['b', 'c'], self.get_suggestions(root, 'test a '))
+		self.assertEqual([], self.get_suggestions(root, 'test x '))
+
+	def test_20_modify_after_execution(self):
+		node = Literal('a').runs(self.callback_dummy)
+		root = Literal('test').then(node)
+		self.run_command_and_check_hit(root, 'test a', False)
+		self.assertRaises(UnknownArgument, self.run_command, root, 'test a b')
+
+		# the tree is frozen after the first execution, but it's still allowed to be modified
+		node.then(Literal('b').runs(self.callback_hit))
+		node.then(Literal('b').then(Integer('c').runs(self.callback_hit)))
+		self.run_command_and_check_hit(root, 'test a b', True)
+		self.run_command_and_check_hit(root, 'test a b 1', True)
+		self.assertEqual(2, len(node.get_children()))
+
+	def test_21_error_handler_order(self):
+		calls = []
+		root = Literal('test'). \
+			on_error(UnknownCommand, lambda: calls.append('old')). \
+			on_error(CommandError, lambda: calls.append('base')). \
+			on_error(UnknownCommand, lambda: calls.append('new'))
+		self.assertRaises(UnknownCommand, self.run_command, root, 'test')
+		# handlers are invoked in registration order, and re-registering an error type replaces the old handler
+		self.assertEqual(['new', 'base'], calls)
+
+	def test_22_suggestion_requirement(self):
+		root = Literal('test').then(
+			Literal('src').requires(lambda src: allowed).then(Literal('a'))
+		).then(
+			Literal('num').then(Integer('ctx').requires(lambda src, ctx: allowed and ctx['ctx'] > 0).then(Literal('b')))
+		)
+		allowed = True
+		self.assertEqual(['a'], self.get_suggestions(root, 'test src '))
+		self.assertEqual(['b'], self.get_suggestions(root, 'test num 1 '))
+		self.assertEqual([], self.get_suggestions(root, 'test num 0 '))
+		allowed = False
+		self.assertEqual([], self.get_suggestions(root, 'test src '))
+		self.assertEqual([], self.get_suggestions(root, 'test num 1 '))
+		# requirements are not tested on the node being completed
+		self.assertEqual(['num', 'src'], self.get_suggestions(root, 'test sr'))
+
 
 class SimpleCommandBuilderTestCase(CommandTestCase):
 	def test_1_basic(self):